@@ -14,6 +14,7 @@ from __future__ import unicode_literals
 
 
 import inspect
+import types
 from . import utils
 from .utils import identity
 import functools
@@ -28,6 +29,75 @@ _False = lambda x: False
 _None = lambda x: None
 _NoLeadingUnderscore = lambda name: name[0] != "_"
 
+# attributes copied from the registered function to its generated method, `_RegisterMethod` takes care of the rest
+_METHOD_ASSIGNMENTS = ('__module__', '__name__', '__doc__')
+
+_METHOD_DOC_TEMPLATE = """
+THIS METHOD IS AUTOMATICALLY GENERATED
+
+    {builder_class}.{name}(*args, **kwargs)
+
+It accepts the same arguments as `{library_path}{original_name}`. {explanation}
+
+**{library_path}{original_name}**
+
+    {fn_docs}
+
+        """
+
+_AT_EXPLANATION_TEMPLATE = """
+However, the 1st argument is omitted, a partial with the rest of the arguments is returned which expects the 1st argument such that
+
+    {{library_path}}{{original_name}}({all_args}*args, **kwargs)
+
+is equivalent to
+
+    {{builder_class}}.{{name}}({previous_args}*args, **kwargs)({last_arg})
+
+        """
+
+def _get_core_names(cls):
+    """
+Returns the names of all the methods defined by `cls` and its bases. It reads the class dictionaries directly instead of using `inspect.getmembers`, which would call `getattr` on every attribute and, on Python 3, miss all the plain methods since `inspect.ismethod` is `False` for them.
+    """
+    return frozenset(
+        name for base in inspect.getmro(cls) for name, member in vars(base).items()
+        if inspect.isfunction(member) or isinstance(member, (classmethod, staticmethod))
+    )
+
+def _copy_function(f):
+    """
+Returns a shallow copy of the plain function `f` so `_RegisterMethod` can set its name and docs without mutating the user's function. Other callables are returned as they are.
+    """
+    if not inspect.isfunction(f):
+        return f
+
+    g = types.FunctionType(f.__code__, f.__globals__, f.__name__, f.__defaults__, f.__closure__)
+    g.__dict__.update(f.__dict__)
+
+    for attr in ('__module__', '__doc__', '__qualname__', '__kwdefaults__', '__annotations__'):
+        if hasattr(f, attr):
+            setattr(g, attr, getattr(f, attr))
+
+    return g
+
+def _register_at(n, name):
+    "Creates the `Register0`, `Register`, ..., `Register5` shortcuts for `RegisterAt(n, ...)`."
+    def register(cls, *args, **kwargs):
+        return cls.RegisterAt(n, *args, **kwargs)
+
+    register.__name__ = str(name)
+    register.__doc__ = """
+`{name}(...)` is a shortcut for `RegisterAt({n}, ...)`
+
+**Also See**
+
+* `phi.builder.Builder.RegisterAt`
+* `phi.builder.Builder.RegisterMethod`
+        """.format(name=name, n=n)
+
+    return classmethod(register)
+
 #######################
 ### Builder
 #######################
@@ -41,24 +111,19 @@ class Builder(dsl.Expression):
         if wrapped:
             f = functools.wraps(wrapped)(f)
 
-        fn_signature = utils.get_method_sig(f)
-        fn_docs = inspect.getdoc(f)
         name = alias if alias else f.__name__
         original_name = f.__name__ if wrapped else original_name if original_name else name
 
         f.__name__ = str(name)
-        f.__doc__ = doc if doc else ("""
-THIS METHOD IS AUTOMATICALLY GENERATED
-
-    {builder_class}.{name}(*args, **kwargs)
-
-It accepts the same arguments as `{library_path}{original_name}`. """ + explanation + """
-
-**{library_path}{original_name}**
-
-    {fn_docs}
 
-        """).format(original_name=original_name, name=name, fn_docs=fn_docs, library_path=library_path, builder_class=cls.__name__) if explain else fn_docs
+        if doc:
+            f.__doc__ = doc
+        elif explain:
+            fn_docs = inspect.getdoc(f)
+            doc_params = dict(original_name=original_name, name=name, fn_docs=fn_docs, library_path=library_path, builder_class=cls.__name__)
+            f.__doc__ = _METHOD_DOC_TEMPLATE.format(explanation=explanation.format(**doc_params), **doc_params)
+        else:
+            f.__doc__ = inspect.getdoc(f)
 
         if name in cls.__core__:
             raise Exception("Can't add method '{0}' because its on __core__".format(name))
@@ -186,20 +251,15 @@ Now the documentation for `MyBuilder.some_fun` will be a little bit nicer since
 * `phi.builder.Builder.PatchAt`
 * `phi.builder.Builder.RegisterAt`
         """
-        unpack_error = True
-
-        try:
+        if len(args) == 2:
             f, library_path = args
-            unpack_error = False
-            cls._RegisterMethod(f, library_path, **kwargs)
+            cls._RegisterMethod(_copy_function(f), library_path, **kwargs)
 
-        except:
-            if not unpack_error:
-                raise
+        else:
+            library_path, = args
 
             def register_decorator(f):
-                library_path, = args
-                cls._RegisterMethod(f, library_path, **kwargs)
+                cls._RegisterMethod(_copy_function(f), library_path, **kwargs)
 
                 return f
             return register_decorator
@@ -210,29 +270,20 @@ Now the documentation for `MyBuilder.some_fun` will be a little bit nicer since
 
         _wrapped = wrapped if wrapped else f
 
-        try:
-            @functools.wraps(f)
-            def method(self, *args, **kwargs):
-
+        def method(self, *args, **kwargs):
+            if _return_type is not None:
                 kwargs['_return_type'] = _return_type
-                return self.ThenAt(n, f, *args, **kwargs)
-        except:
-            raise
-
-        all_args, previous_args, last_arg = _make_args_strs(n)
 
-        explanation = """
-However, the 1st argument is omitted, a partial with the rest of the arguments is returned which expects the 1st argument such that
-
-    {library_path}{original_name}("""+ all_args +"""*args, **kwargs)
-
-is equivalent to
+            return self.ThenAt(n, f, *args, **kwargs)
 
-    {builder_class}.{name}("""+ previous_args +"""*args, **kwargs)("""+ last_arg +""")
+        functools.update_wrapper(method, f, assigned=_METHOD_ASSIGNMENTS, updated=())
 
-        """ + explanation  if explain else ""
+        if explain:
+            explanation = _get_at_explanation(n) + explanation
+        else:
+            explanation = ""
 
-        cls.RegisterMethod(method, library_path, alias=alias, original_name=original_name, doc=doc, wrapped=wrapped, explanation=explanation, method_type=method_type, explain=explain)
+        cls._RegisterMethod(method, library_path, alias=alias, original_name=original_name, doc=doc, wrapped=wrapped, explanation=explanation, method_type=method_type, explain=explain)
 
     @classmethod
     def RegisterAt(cls, *args, **kwargs):
@@ -266,98 +317,28 @@ For this case you can just use `Register` which is a shortcut for `RegisterAt(1,
 
 * `phi.builder.Builder.RegisterMethod`
         """
-        unpack_error = True
-
-        try:
+        if len(args) == 3:
             n, f, library_path = args
-            unpack_error = False
             cls._RegisterAt(n, f, library_path, **kwargs)
 
-        except:
-            if not unpack_error:
-                raise
+        else:
+            n, library_path = args
 
             def register_decorator(f):
-                n, library_path = args
                 cls._RegisterAt(n, f, library_path, **kwargs)
 
                 return f
             return register_decorator
 
-    @classmethod
-    def Register0(cls, *args, **kwargs):
-        """
-`Register0(...)` is a shortcut for `RegisterAt(0, ...)`
-
-**Also See**
-
-* `phi.builder.Builder.RegisterAt`
-* `phi.builder.Builder.RegisterMethod`
-        """
-        return cls.RegisterAt(0, *args, **kwargs)
-
-    @classmethod
-    def Register(cls, *args, **kwargs):
-        """
-`Register(...)` is a shortcut for `RegisterAt(1, ...)`
-
-**Also See**
-
-* `phi.builder.Builder.RegisterAt`
-* `phi.builder.Builder.RegisterMethod`
-        """
-        return cls.RegisterAt(1, *args, **kwargs)
+    Register0 = _register_at(0, "Register0")
+    Register = _register_at(1, "Register")
+    Register2 = _register_at(2, "Register2")
+    Register3 = _register_at(3, "Register3")
+    Register4 = _register_at(4, "Register4")
+    Register5 = _register_at(5, "Register5")
 
     @classmethod
-    def Register2(cls, *args, **kwargs):
-        """
-`Register2(...)` is a shortcut for `RegisterAt(2, ...)`
-
-**Also See**
-
-* `phi.builder.Builder.RegisterAt`
-* `phi.builder.Builder.RegisterMethod`
-        """
-        return cls.RegisterAt(2, *args, **kwargs)
-
-    @classmethod
-    def Register3(cls, *args, **kwargs):
-        """
-`Register3(...)` is a shortcut for `RegisterAt(3, ...)`
-
-**Also See**
-
-* `phi.builder.Builder.RegisterAt`
-* `phi.builder.Builder.RegisterMethod`
-        """
-        return cls.RegisterAt(3, *args, **kwargs)
-
-    @classmethod
-    def Register4(cls, *args, **kwargs):
-        """
-`Register4(...)` is a shortcut for `RegisterAt(4, ...)`
-
-**Also See**
-
-* `phi.builder.Builder.RegisterAt`
-* `phi.builder.Builder.RegisterMethod`
-        """
-        return cls.RegisterAt(4, *args, **kwargs)
-
-    @classmethod
-    def Register5(cls, *args, **kwargs):
-        """
-`Register5(...)` is a shortcut for `RegisterAt(5, ...)`
-
-**Also See**
-
-* `phi.builder.Builder.RegisterAt`
-* `phi.builder.Builder.RegisterMethod`
-        """
-        return cls.RegisterAt(5, *args, **kwargs)
-
-    @classmethod
-    def PatchAt(cls, n, module, method_wrapper=None, module_alias=None, method_name_modifier=utils.identity, blacklist_predicate=_False, whitelist_predicate=_True, return_type_predicate=_None, getmembers_predicate=inspect.isfunction, admit_private=False, explanation=""):
+    def PatchAt(cls, n, module, method_wrapper=None, module_alias=None, method_name_modifier=utils.identity, blacklist_predicate=_False, whitelist_predicate=_True, return_type_predicate=_None, getmembers_predicate=inspect.isfunction, admit_private=False, explanation="", explain=False):
         """
 This classmethod lets you easily patch all of functions/callables from a module or class as methods a Builder class.
 
@@ -371,6 +352,7 @@ This classmethod lets you easily patch all of functions/callables from a module
 * `whitelist_predicate = lambda f_name: True` : A predicate that determines which functions are admitted given their name. By default it include any function. `whitelist_predicate` can also be of type list, in which case only names contained in this list will be admitted. You can use both `blacklist_predicate` and `whitelist_predicate` at the same time.
 * `return_type_predicate = lambda f_name: None` : a predicate that determines the `_return_type` of the Builder. By default it will always return `None`. See `phi.builder.Builder.ThenAt`.
 * `getmembers_predicate = inspect.isfunction` : a predicate that determines what type of elements/members will be fetched by the `inspect` module, defaults to [inspect.isfunction](https://docs.python.org/2/library/inspect.html#inspect.isfunction). See [getmembers](https://docs.python.org/2/library/inspect.html#inspect.getmembers).
+* `explain = False` : whether to generate the documentation of each patched method, see `phi.builder.Builder.RegisterMethod`. Its off by default since patching a big module means building and formatting the docs of hundreds of methods that are rarely read, set it to `True` if you want `help` to show them.
 
 **Examples**
 
@@ -431,10 +413,10 @@ The thing to notice is that with the `NumpyBuilder` we avoid the repetitive and
             else:
                 g = f
 
-            cls.RegisterAt(n, g, module_name, wrapped=wrapped, _return_type=return_type_predicate(name), alias=method_name_modifier(name), explanation=explanation)
+            cls._RegisterAt(n, g, module_name, wrapped=wrapped, _return_type=return_type_predicate(name), alias=method_name_modifier(name), explanation=explanation, explain=explain)
 
 
-Builder.__core__ = [ name for name, f in inspect.getmembers(Builder, inspect.ismethod) ]
+Builder.__core__ = _get_core_names(Builder)
 
 
 
@@ -454,15 +436,30 @@ def _make_args_strs(n):
 
     return ", ".join(all_args + [""]), ", ".join(previous + [""]), last
 
+_at_explanations = {}
+
+def _get_at_explanation(n):
+    "Returns `_AT_EXPLANATION_TEMPLATE` filled with the argument strings of position `n`, its formatted once per position."
+    explanation = _at_explanations.get(n)
+
+    if explanation is None:
+        all_args, previous_args, last_arg = _make_args_strs(n)
+        explanation = _at_explanations[n] = _AT_EXPLANATION_TEMPLATE.format(all_args=all_args, previous_args=previous_args, last_arg=last_arg)
+
+    return explanation
+
 def _get_patch_members(module, blacklist_predicate=_NoLeadingUnderscore, whitelist_predicate=_True, _return_type=None, getmembers_predicate=inspect.isfunction, admit_private=False):
 
     if type(whitelist_predicate) is list:
-        whitelist = whitelist_predicate
-        whitelist_predicate = lambda x: x in whitelist
+        whitelist_predicate = frozenset(whitelist_predicate).__contains__
 
     if type(blacklist_predicate) is list:
-        blacklist = blacklist_predicate
-        blacklist_predicate = lambda x: x in blacklist or '_' == x[0] if not admit_private else False
+        blacklist = frozenset(blacklist_predicate)
+
+        if admit_private:
+            blacklist_predicate = blacklist.__contains__
+        else:
+            blacklist_predicate = lambda x: x in blacklist or x[:1] == '_'
 
     return [
         (name, f) for (name, f) in inspect.getmembers(module, getmembers_predicate) if whitelist_predicate(name) and not blacklist_predicate(name)
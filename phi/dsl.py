@@ -177,9 +177,11 @@ from __future__ import unicode_literals
 from .utils import identity
 from . import utils
 from abc import ABCMeta, abstractmethod
-from inspect import isclass
+import inspect
 import functools
 import operator
+import threading
+import types
 
 ###############################
 # Expression Helpers
@@ -201,7 +203,11 @@ def _fmap(opt):
             return y_out, state_out
 
 
-        return self.__unit__(h)
+        expr = self.__unit__(h)
+        #only rendered by `_get_source` when the expression is jitted
+        expr._source = (_binary_source, opt, self, other)
+
+        return expr
 
     return method
 
@@ -220,22 +226,233 @@ def _fmap_flip(opt):
             return y_out, state
 
 
-        return self.__unit__(h)
+        expr = self.__unit__(h)
+        expr._source = (_binary_source, opt, other, self)
+
+        return expr
 
     return method
 
 def _unary_fmap(opt):
     def method(self):
-        return self.__then__(utils.lift(opt))
+        expr = self.__then__(utils.lift(opt))
+
+        expr._source = (_unary_source, opt, self)
+
+        return expr
 
     return method
 
+###############################
+# Source Helpers
+###############################
+
+_BINARY_SYMBOLS = {
+    operator.add: "+", operator.mul: "*", operator.sub: "-", operator.mod: "%", operator.pow: "**",
+    operator.and_: "&", operator.or_: "|", operator.xor: "^",
+    operator.truediv: "/", operator.floordiv: "//",
+    operator.lt: "<", operator.le: "<=", operator.gt: ">", operator.ge: ">=", operator.eq: "==", operator.ne: "!="
+}
+_UNARY_SYMBOLS = { operator.neg: "-", operator.pos: "+", operator.invert: "~" }
+
+def _get_source(code):
+    """
+Returns the python source of `code` as an expression of the input `x`, or `None` if `code` is not made only of arithmetic operations over the input and numeric constants. E.g. the source of `(P + 1) * 2` is `"((x + (1)) * (2))"`. Operators only store `(render, *args)` in `_source` and the string is built here, so expressions that are never jitted don't pay for it.
+    """
+    if isinstance(code, Expression):
+        if code._f is utils.state_identity:
+            return "x"
+
+        source = getattr(code, '_source', None)
+        return source[0](*source[1:]) if source is not None else None
+    elif type(code) in (bool, int) or (type(code) is float and code - code == 0):
+        return "({0!r})".format(code)
+    else:
+        return None
+
+def _binary_source(opt, a, b):
+    if opt not in _BINARY_SYMBOLS:
+        return None
+
+    source_a = _get_source(a)
+    source_b = _get_source(b) if source_a is not None else None
+
+    if source_b is None:
+        return None
+
+    return "({0} {1} {2})".format(source_a, _BINARY_SYMBOLS[opt], source_b)
+
+def _unary_source(opt, a):
+    source = _get_source(a)
+    return "({0}{1})".format(_UNARY_SYMBOLS[opt], source) if source is not None else None
+
+def _getitem_source(a, key):
+    source = _get_source(a) if type(key) is int else None
+    return "{0}[{1!r}]".format(source, key) if source is not None else None
+
+def _compile_jit(code):
+    """
+Generates a single function that applies each source in `sources` in sequence and compiles it with `numba.njit` if numba is installed. Sources can call the plain python functions in `functions` as `_f0(x)`, `_f1(x)`, etc, for the numba version these are also compiled with `numba.njit`.
+    """
+    sources, functions = code
+    lines = [ "def _f(x):" ] + [ "    x = " + source for source in sources ] + [ "    return x" ]
+    source = "\n".join(lines)
+    f = _exec_source(source, functions)
+
+    try:
+        import numba
+        from numba.core.errors import NumbaError
+    except ImportError:
+        return f
+
+    compiled = [ numba.njit(_exec_source(source, [ numba.njit(h) for h in functions ])) ]
+
+    def g(x):
+        try:
+            return compiled[0](x)
+        except NumbaError:
+            #numba can't handle this input, this expression uses the python version from now on
+            compiled[0] = f
+            return f(x)
+
+    return g
+
+_UNROLL_SIZE = 16
+_unrolled_codes = {}
+
+def _unrolled_code(key, make_lines):
+    "Returns the code object of the `_h` function defined by the source lines `make_lines()`, its generated once per `key`."
+    code = _unrolled_codes.get(key)
+
+    if code is None:
+        namespace = {}
+        exec("\n".join(make_lines()), namespace)
+        code = _unrolled_codes[key] = namespace["_h"].__code__
+
+    return code
+
+#displays used by `_unrolled_list` to build the result of each container type
+_UNROLLED_DISPLAYS = {
+    list: "[{0}]",
+    tuple: "({0},)",
+    set: "{{{0}}}",
+}
+
+def _unrolled_list(gs, container=list):
+    """
+Returns a state-passing function equivalent to the loop of `List` but with the branches unrolled, e.g. for 2 branches
+
+    def _h(x, state):
+        y0, state = _g0(x, state)
+        y1, state = _g1(x, state)
+        return [y0, y1], state
+
+`container` can also be `tuple` or `set`, in which case the result is built with a tuple or set display instead of converting a list afterwards. The code object is generated once per container type and number of branches and then bound to the branches of each expression.
+    """
+    n = len(gs)
+    display = _UNROLLED_DISPLAYS[container] if n > 0 else "_container({0})"
+    make_lines = lambda: (
+        [ "def _h(x, state):" ] +
+        [ "    y{0}, state = _g{0}(x, state)".format(i) for i in range(n) ] +
+        [ "    return " + display.format(", ".join("y{0}".format(i) for i in range(n))) + ", state" ]
+    )
+    code = _unrolled_code((container, n), make_lines)
+
+    namespace = { "_g{0}".format(i): g for i, g in enumerate(gs) }
+    namespace["_container"] = container
+
+    return types.FunctionType(code, namespace)
+
+def _unrolled_dict(items):
+    """
+Same as `_unrolled_list` but for the `(key, g)` pairs of `Dict`, the result is built as
+
+    return _Record({_k0: y0, _k1: y1}), state
+    """
+    n = len(items)
+    make_lines = lambda: (
+        [ "def _h(x, state):" ] +
+        [ "    y{0}, state = _g{0}(x, state)".format(i) for i in range(n) ] +
+        [ "    return _Record({{{0}}}), state".format(", ".join("_k{0}: y{0}".format(i) for i in range(n))) ]
+    )
+    code = _unrolled_code(('dict', n), make_lines)
+
+    namespace = { "_Record": _RecordObject }
+    for i, (key, g) in enumerate(items):
+        namespace["_k{0}".format(i)] = key
+        namespace["_g{0}".format(i)] = g
+
+    return types.FunctionType(code, namespace)
+
+def _exec_source(source, functions):
+    namespace = { "_f{0}".format(i): h for i, h in enumerate(functions) }
+    exec(source, namespace)
+
+    return namespace["_f"]
+
+def _jit_code(sequence):
+    "Returns the `(sources, functions)` pair `_compile_jit` expects for `sequence` or `None` if some element can't be jitted."
+    sources = []
+    functions = []
+
+    for elem in sequence:
+        source = _get_source(elem)
+
+        if source is None and inspect.isfunction(elem):
+            source = "_f{0}(x)".format(len(functions))
+            functions.append(elem)
+        elif source is None:
+            return None
+
+        sources.append(source)
+
+    return tuple(sources), tuple(functions)
+
+def _make_state_partial(n, f, args, kwargs):
+    """
+Returns a state-passing function that applies its input to `f` at position `n` along with `args` and `kwargs`, the splitting of `args` is done here once so it's not rebuilt on every call. `f` is called directly instead of lifting an intermediate partial, this saves a Python frame on every call of the expressions built by `ThenAt` and the registered methods. When the input goes last `functools.partial` is used since its call is implemented in C.
+    """
+    if n == 1 and not args and not kwargs:
+        return utils.lift(f)
+    elif n <= 0:
+        p = functools.partial(f, *args, **kwargs)
+        return lambda x, state: (p(), state)
+    elif n == len(args) + 1:
+        p = functools.partial(f, *args, **kwargs)
+        return lambda x, state: (p(x), state)
+    elif n == 1:
+        return lambda x, state: (f(x, *args, **kwargs), state)
+    elif n == 2 and args:
+        a = args[0]
+        tail = args[1:]
+        return lambda x, state: (f(a, x, *tail, **kwargs), state)
+
+    head = args[0:n - 1]
+    tail = args[n - 1:]
+
+    return lambda x, state: (f(*(head + (x,) + tail), **kwargs), state)
+
+def _lifted(f):
+    "Returns `utils.lift(f)`, except for the identity which is mapped to `utils.state_identity` so composing it adds no stage at all."
+    if f is utils.identity:
+        return utils.state_identity
+
+    return utils.lift(f)
+
+def _constant(val):
+    """
+Returns the state-passing constant function of `val`, it ignores its input and returns `val` directly instead of lifting `lambda z: val` which would cost an extra call. `val` is bound as a default argument so it's read as a fast local instead of a closure cell.
+    """
+    return lambda x, state, val=val: (val, state)
+
 ###############################
 # Helpers
 ###############################
 class _RefProxy(object):
     """docstring for _ReadProxy."""
 
+    __slots__ = ()
+
     def __getattr__(self, name):
         return _StateContextManager.REFS[name]
 
@@ -249,6 +466,8 @@ _RefProxyInstance = _RefProxy()
 
 class _StateContextManager(object):
 
+    __slots__ = ('previous_refs', 'next_refs')
+
     REFS = None
 
     def __init__(self, next_refs):
@@ -303,6 +522,9 @@ assert {'a': 97, 'b': 98, 'c': 99} == P.Pipe(
 )
 
     """
+
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value=utils.NO_VALUE):
         super(Ref, self).__init__()
         self.name = name
@@ -334,6 +556,8 @@ Sets the value of the reference equal to the input argument `x`. Its also an ide
 class _ReadProxy(object):
     """docstring for _ReadProxy."""
 
+    __slots__ = ('__builder__',)
+
     def __init__(self, __builder__):
         self.__builder__ = __builder__
 
@@ -355,13 +579,24 @@ class _ReadProxy(object):
 class _ObjectProxy(object):
     """docstring for Underscore."""
 
+    __slots__ = ('__builder__', '__methods__')
+
     def __init__(self, __builder__):
         self.__builder__ = __builder__
+        self.__methods__ = {}
 
     def __getattr__(self, name):
+        method_proxy = self.__methods__.get(name)
+
+        if method_proxy is None:
+            method_proxy = self.__methods__[name] = self.__method_proxy__(name)
+
+        return method_proxy
+
+    def __method_proxy__(self, name):
 
         def method_proxy(*args, **kwargs):
-            f = lambda x: getattr(x, name)(*args, **kwargs)
+            f = operator.methodcaller(str(name), *args, **kwargs)
             return self.__builder__.__then__(utils.lift(f))
 
         return method_proxy
@@ -369,15 +604,19 @@ class _ObjectProxy(object):
 class _RecordProxy(object):
     """docstring for _RecordProxy."""
 
+    __slots__ = ('__builder__',)
+
     def __init__(self, __builder__):
         self.__builder__ = __builder__
 
     def __call__(self, attr):
-        f = utils.lift(lambda x: getattr(x, attr))
+        #attrgetter would follow dotted names, getattr doesn't
+        get = (lambda x: getattr(x, attr)) if '.' in attr else operator.attrgetter(str(attr))
+        f = utils.lift(get)
         return self.__builder__.__then__(f)
 
     def __getattr__ (self, attr):
-        f = utils.lift(lambda x: getattr(x, attr))
+        f = utils.lift(operator.attrgetter(attr))
         return self.__builder__.__then__(f)
 
 
@@ -385,25 +624,25 @@ class _RecordProxy(object):
 
 class _RecordObject(dict):
     """docstring for DictObject."""
-    def __init__(self,*arg,**kw):
-      super(_RecordObject, self).__init__(*arg, **kw)
+
+    #fields only live in the dict itself, attribute access is forwarded to it
+    __slots__ = ()
 
     def __getattr__ (self, attr):
-        return self[attr]
+        try:
+            return self[attr]
+        except KeyError:
+            raise AttributeError(attr)
 
-class _WithContextManager(object):
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
 
-    WITH_GLOBAL_CONTEXT = utils.NO_VALUE
+class _WithScope(threading.local):
+    "Holds the context object of the innermost running `With` block, one per thread so concurrent pipelines don't see each other's contexts."
+    context = utils.NO_VALUE
 
-    def __init__(self, new_scope):
-        self.new_scope = new_scope
-        self.old_scope = _WithContextManager.WITH_GLOBAL_CONTEXT
+_with_scope = _WithScope()
 
-    def __enter__(self):
-        _WithContextManager.WITH_GLOBAL_CONTEXT = self.new_scope
-
-    def __exit__(self, *args):
-        _WithContextManager.WITH_GLOBAL_CONTEXT = self.old_scope
 ###############################
 # DSL Elements
 ###############################
@@ -439,9 +678,12 @@ and piping through a function is just the same a applying the function
         f = self._f
         g = other
 
-        h = lambda x, state: g(*f(x, state))
+        if f is utils.state_identity:
+            return self.__unit__(g, **kwargs)
+        elif g is utils.state_identity:
+            return self.__unit__(f, **kwargs)
 
-        return self.__unit__(h, **kwargs)
+        return self.__unit__(_chain((f, g)), **kwargs)
 
 
     def __call__(self, __x__, *__return_state__, **state):
@@ -518,7 +760,14 @@ The previous using [lambdas](https://cgarciae.github.io/phi/lambdas.m.html) to c
 * [Compile](https://cgarciae.github.io/phi/dsl.m.html#phi.dsl.Compile)
 * [lambdas](https://cgarciae.github.io/phi/lambdas.m.html)
         """
-        state = kwargs.pop("refs", {})
+        #always a fresh dict, Write updates the active refs in place
+        state = dict(kwargs.pop("refs", ()))
+
+        if not kwargs and self._f is utils.state_identity:
+            #run the compiled sequence directly, no need to build an intermediate Expression
+            with _StateContextManager(state):
+                return _compile_seq(sequence)(None, state)[0]
+
         return self.Seq(*sequence, **kwargs)(None, **state)
 
     def ThenAt(self, n, f, *_args, **kwargs):
@@ -622,18 +871,9 @@ As you see, `Then2` was very useful because `map` accepts and `iterable` as its
 * [PythonBuilder](https://cgarciae.github.io/phi/python_builder.m.html)
 * `phi.builder.Builder.RegisterAt`
         """
-        _return_type = None
-        n_args = n - 1
-
-        if '_return_type' in kwargs:
-            _return_type = kwargs['_return_type']
-            del kwargs['_return_type']
+        _return_type = kwargs.pop('_return_type', None)
 
-        @utils.lift
-        def g(x):
-
-            new_args = _args[0:n_args] + (x,) + _args[n_args:] if n_args >= 0 else _args
-            return f(*new_args, **kwargs)
+        g = _make_state_partial(n, f, _args, kwargs)
 
         return self.__then__(g, _return_type=_return_type)
 
@@ -782,6 +1022,9 @@ Check out the documentatio for Phi [lambdas](https://cgarciae.github.io/phi/lamb
         """
         gs = [ _parse(code)._f for code in branches ]
 
+        if len(gs) <= _UNROLL_SIZE:
+            return self.__then__(_unrolled_list(gs), **kwargs)
+
         def h(x, state):
             ys = []
             for g in gs:
@@ -793,9 +1036,17 @@ Check out the documentatio for Phi [lambdas](https://cgarciae.github.io/phi/lamb
         return self.__then__(h, **kwargs)
 
     def Tuple(self, *expressions, **kwargs):
+        if len(expressions) <= _UNROLL_SIZE:
+            gs = [ _parse(code)._f for code in expressions ]
+            return self.__then__(_unrolled_list(gs, tuple), **kwargs)
+
         return self.List(*expressions) >> tuple
 
     def Set(self, *expressions, **kwargs):
+        if len(expressions) <= _UNROLL_SIZE:
+            gs = [ _parse(code)._f for code in expressions ]
+            return self.__then__(_unrolled_list(gs, set), **kwargs)
+
         return self.List(*expressions) >> set
 
     def Seq(self, *sequence, **kwargs):
@@ -838,6 +1089,17 @@ is equivalent to
 
     lambda x: x
 
+**JIT**
+
+If you pass `jit=True` and every element of the sequence is an arithmetic expression over the input (e.g. `P + 1`, `P * P`, `P[0] - 2`), a numeric constant or a plain python function, the whole sequence is generated as a single python function which is compiled with [numba](https://numba.pydata.org/) if its installed. If any element can't be expressed this way `jit` is ignored.
+
+    f = Seq(P + 1, P * 3, jit=True)  # def f(x): x = x + 1; x = x * 3; return x
+    assert f(2) == 9
+
+Plain functions are called from the generated function and are also compiled with numba, if numba can't compile the sequence for a given input the python version is used from then on. `Val`, `Obj`, `Rec`, `Read`, `Write` and other expressions that aren't arithmetic are never jitted.
+
+Note that the numba version uses numba's numeric semantics, not python's: integers are 64 bit and silently wrap around on overflow, e.g. `Seq(P * P, jit=True)(2**40)` does not return `2**80` when numba is installed. Only use `jit` where the values fit in machine types.
+
 ### Examples
 
     from phi import P, Seq
@@ -861,16 +1123,26 @@ The previous example using `P.Pipe`
         P ** 2  #3 ** 2 == 9
     )
         """
-        fs = [ _parse(elem)._f for elem in sequence ]
+        jit = kwargs.pop('jit', False)
+        code = _jit_code(sequence) if jit and sequence else None
 
-        def g(x, state):
-            return functools.reduce(lambda args, f: f(*args), fs, (x, state))
+        if code is not None:
+            f = _compile_jit(code)
+            return self.__then__(utils.lift(f), **kwargs)
+
+        if not sequence and not kwargs:
+            return self
+
+        g = _compile_seq(sequence)
 
         return self.__then__(g, **kwargs)
 
     def Dict(self, **branches):
         gs = { key : _parse(value)._f for key, value in branches.items() }
 
+        if len(gs) <= _UNROLL_SIZE:
+            return self.__then__(_unrolled_dict(list(gs.items())))
+
         def h(x, state):
             ys = {}
 
@@ -967,8 +1239,13 @@ The previous is equivalent to
         def g(x, state):
             context, state = context_f(x, state)
             with context as scope:
-                with _WithContextManager(scope):
+                previous_scope = _with_scope.context
+                _with_scope.context = scope
+
+                try:
                     return body_f(x, state)
+                finally:
+                    _with_scope.context = previous_scope
 
         return self.__then__(g, **kwargs)
 
@@ -1049,8 +1326,10 @@ Same as `phi.dsl.Expression.List` but any string argument `x` is translated to `
 
 
         def g(x, state):
-            update = { key: x for key in state_args }
-            state = utils.merge(state, update)
+            state = state.copy()
+
+            for key in state_args:
+                state[key] = x
 
             #side effect for convenience
             _StateContextManager.REFS.update(state)
@@ -1198,7 +1477,7 @@ is equivalent to
 
 The previous expression as a whole is a constant function since it will return `2` no matter what input you give it.
         """
-        f = utils.lift(lambda z: val)
+        f = _constant(val)
 
         return self.__then__(f, **kwargs)
 
@@ -1335,10 +1614,12 @@ Here we called `Context` with no arguments to get the context back, however, sin
 * `phi.builder.Builder.Obj`
 * [dsl](https://cgarciae.github.io/phi/dsl.m.html)
         """
-        if _WithContextManager.WITH_GLOBAL_CONTEXT is utils.NO_VALUE:
+        scope = _with_scope.context
+
+        if scope is utils.NO_VALUE:
             raise Exception("Cannot use 'Context' outside of a 'With' block")
 
-        return _WithContextManager.WITH_GLOBAL_CONTEXT
+        return scope
 
 
     ###############
@@ -1357,42 +1638,15 @@ Here we called `Context` with no arguments to get the context back, however, sin
     __lshift__ = __rrshift__
 
 
-    ## The Rest
-
-    def __unit__(self, f, _return_type=None):
-        "Monadic unit, also known as `return`"
-        if _return_type:            
-            return _return_type(f)
-        else:
-            return self.__class__(f)
-
-    def __then__(self, other, **kwargs):
-        f = self._f
-        g = other
-
-        h = lambda x, state: g(*f(x, state))
-
-        return self.__unit__(h, **kwargs)
-
     ## Override operators
-    def __call__(self, __x__, *__return_state__, **state):
-        x = __x__
-        return_state = __return_state__
-
-        if len(return_state) == 1 and type(return_state[0]) is not bool:
-            raise Exception("Invalid return state condition, got {return_state}".format(return_state=return_state))
-
-        with _StateContextManager(state):
-            y, next_state = self._f(x, state)
-
-        return (y, next_state) if len(return_state) >= 1 and return_state[0] else y
-
 
+    def __getitem__(self, key):
+        f = utils.lift(operator.itemgetter(key))
+        expr = self.__then__(f)
 
+        expr._source = (_getitem_source, self, key)
 
-    def __getitem__(self, key):
-        f = utils.lift(lambda x: x[key])
-        return self.__then__(f)
+        return expr
 
 
 
@@ -1476,12 +1730,15 @@ def _compile_if(ast):
 
 
 def _parse(code):
+    parse = _PARSE_DISPATCH.get(type(code))
+
+    if parse is not None:
+        return parse(code)
 
-    #if type(code) is tuple:
     if isinstance(code, Expression):
         return code
-    elif hasattr(code, '__call__') or isclass(code):
-        return Expression(utils.lift(code))
+    elif callable(code):
+        return Expression(_lifted(code))
     elif isinstance(code, list):
         return E.List(*code)
     elif isinstance(code, tuple):
@@ -1492,3 +1749,104 @@ def _parse(code):
         return E.Dict(**code)
     else:
         return E.Val(code)
+
+#exact types of the literals used inside the DSL, `_parse` checks these before its isinstance chain
+_PARSE_DISPATCH = {
+    list: lambda code: E.List(*code),
+    tuple: lambda code: E.Tuple(*code),
+    set: lambda code: E.Set(*code),
+    dict: lambda code: E.Dict(**code),
+}
+
+
+def _compile_seq(sequence):
+    fs = []
+    run = []
+
+    for elem in sequence:
+        if _is_plain_function(elem):
+            run.append(elem)
+            continue
+
+        if run:
+            fs.append(_compile_run(run))
+            run = []
+
+        fs.append(_parse(elem)._f)
+
+    if run:
+        fs.append(_compile_run(run))
+
+    if len(fs) == 0:
+        return utils.state_identity
+    elif len(fs) == 1:
+        return fs[0]
+
+    return _chain(tuple(fs))
+
+def _is_plain_function(code):
+    return not isinstance(code, Expression) and callable(code)
+
+def _compile_run(fs):
+    """
+Generates a single state-passing function that applies the plain functions in `fs` in straight-line code, e.g. for `[f0, f1]`
+
+    def _h(x, state):
+        x = _f0(x)
+        x = _f1(x)
+        return x, state
+
+this way consecutive plain functions in a `Seq` don't pay for lifting each one and looping over them. Like `_unrolled_list`, the code object is generated once per number of functions and then bound to `fs`.
+    """
+    if len(fs) == 1:
+        return utils.lift(fs[0])
+
+    n = len(fs)
+    make_lines = lambda: (
+        [ "def _h(x, state):" ] +
+        [ "    x = _f{0}(x)".format(i) for i in range(n) ] +
+        [ "    return x, state" ]
+    )
+    code = _unrolled_code(('run', n), make_lines)
+
+    return types.FunctionType(code, { "_f{0}".format(i): f for i, f in enumerate(fs) })
+
+def _stages(f):
+    """
+Returns the flat tuple of state-passing functions run by `f`. Chains built by `_chain` are expanded iteratively with a stack of iterators, any other function is returned as `(f,)`.
+    """
+    stages = []
+    stack = [ iter((f,)) ]
+
+    while stack:
+        for h in stack[-1]:
+            parts = getattr(h, '_parts', None)
+
+            if parts is not None:
+                stack.append(iter(parts))
+                break
+
+            stages.append(h)
+        else:
+            stack.pop()
+
+    return tuple(stages)
+
+def _chain(parts):
+    """
+Returns a state-passing function that runs the functions in `parts` one after the other in a single loop. `parts` can contain other chains, these are only flattened with `_stages` the first time the function is called, so composing `n` functions is linear and a pipeline of `n` stages runs in one frame instead of `n` nested ones.
+    """
+    flat = []
+
+    def g(x, state):
+        if not flat:
+            flat.append(_stages(g))
+
+        for f in flat[0]:
+            x, state = f(x, state)
+
+        return x, state
+
+    g._parts = parts
+
+    return g
@@ -28,7 +28,7 @@ _functions_2 = [ (_name, f) for _name, f in __builtins__.items() if _name in _fu
 
 for _name, f in __builtins__.items():
     try:
-        if hasattr(f, "__name__") and _name[0] is not "_" and not _name[0].isupper() and _name not in _function_2_names:
+        if hasattr(f, "__name__") and _name[0] != "_" and not _name[0].isupper() and _name not in _function_2_names:
             PythonBuilder.Register(f, "", alias=_name)
     except Exception as e:
         print(e)
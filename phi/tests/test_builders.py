@@ -67,6 +67,31 @@ class TestBuilder(object):
 
         assert f(2.0) == 4
 
+    def test_patch_members(self):
+        from . import some_module
+        from phi.builder import _get_patch_members
+
+        names = lambda **kwargs: [ name for name, f in _get_patch_members(some_module, **kwargs) ]
+
+        assert names(whitelist_predicate=["some_fun"], blacklist_predicate=lambda name: False) == ["some_fun"]
+        assert names(blacklist_predicate=["some_fun"]) == ["other_fun"]
+        assert names(blacklist_predicate=["some_fun"], admit_private=True) == ["other_fun"]
+
+        #members are looked up again on every call
+        from phi import Builder
+
+        class MyBuilder(Builder):
+            pass
+
+        some_fun = some_module.some_fun
+        try:
+            some_module.some_fun = lambda x: "NEW"
+            MyBuilder.PatchAt(1, some_module, whitelist_predicate=["some_fun"])
+        finally:
+            some_module.some_fun = some_fun
+
+        assert MyBuilder().some_fun()(None) == "NEW"
+
     def test_methods(self):
         x = P.Pipe(
             "hello world",
@@ -317,6 +342,36 @@ class TestBuilder(object):
         assert length == 11
         assert y() == "hello world"
 
+        with pytest.raises(Exception):
+            Context()
+
+    def test_context_threads(self):
+        import threading
+
+        n = 8
+        inside = [0]
+        condition = threading.Condition()
+        results = []
+
+        def body(x):
+            #wait until every thread is inside its With body
+            with condition:
+                inside[0] += 1
+                condition.notify_all()
+
+                while inside[0] < n:
+                    condition.wait(10)
+
+            return Context()
+
+        f = P.With(DummyContext, P.Then(body))
+        threads = [ threading.Thread(target=lambda i=i: results.append((i, f(i)))) for i in range(n) ]
+
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        assert sorted(results) == [ (i, i) for i in range(n) ]
+
     def test_register_1(self):
 
         #register
@@ -334,6 +389,90 @@ class TestBuilder(object):
         #RegisterMethod
         assert P.give_me_1000() == 1000
 
+    def test_register_errors(self):
+        #errors while registering are not swallowed
+        from phi import Builder
+
+        class MyBuilder(Builder):
+            pass
+
+        def Seq(x):
+            return x
+
+        with pytest.raises(Exception):
+            MyBuilder.Register(Seq, "test.lib.")
+
+        with pytest.raises(Exception):
+            MyBuilder.Register("test.lib.")(Seq)
+
+    def test_register_method_copies(self):
+        from phi import Builder
+
+        class MyBuilder(Builder):
+            pass
+
+        def get_value(self, y=1):
+            "Some docs"
+            return y
+
+        MyBuilder.RegisterMethod(get_value, "test.lib.", alias="first", doc="First")
+        MyBuilder.RegisterMethod(get_value, "test.lib.", alias="second", doc="Second")
+
+        assert get_value.__name__ == "get_value"
+        assert get_value.__doc__ == "Some docs"
+        assert MyBuilder.first.__name__ == "first"
+        assert MyBuilder.second.__doc__ == "Second"
+        assert MyBuilder(None).first(2) == 2
+
+        def indented(self):
+            """
+            Indented docs
+            """
+
+        MyBuilder.RegisterMethod(indented, "test.lib.", explain=False)
+        assert MyBuilder.indented.__doc__ == "Indented docs"
+
+    def test_then_at_override(self):
+        from phi import Builder
+
+        calls = []
+
+        class MyBuilder(Builder):
+            def ThenAt(self, n, f, *args, **kwargs):
+                calls.append(n)
+                return super(MyBuilder, self).ThenAt(n, f, *args, **kwargs)
+
+        MyBuilder.Register2(pow, "test.lib.", alias="pow2")
+        b = MyBuilder()
+
+        assert b.Then(add, 1)(2) == 3
+        assert b.Then3(a2_plus_b_minus_2c, 2, 4)(3) == 2
+        assert b.pow2(2)(3) == 8
+        assert calls == [1, 3, 2]
+
+        #a _return_type given by the caller is passed through
+        assert type(P.add(2, _return_type=MyBuilder)) is MyBuilder
+        assert type(P.add(2)) is type(P)
+
+    def test_flatten(self):
+        from phi import utils
+
+        nested = [1]
+        for i in range(5000):
+            nested = [nested, 2]
+
+        assert utils.flatten_list(nested) == [1] + [2] * 5000
+        assert P.Pipe([["ab", (1, [2])], "c"], P.Flatten()) == ["ab", 1, 2, "c"]
+
+    def test_core(self):
+        from phi import Builder
+
+        #plain methods, classmethods and inherited Expression methods are all core
+        assert "Seq" in Builder.__core__
+        assert "RegisterAt" in Builder.__core__
+        assert "__then__" in Builder.__core__
+        assert "add" not in Builder.__core__
+
     def test_reference(self):
         add_ref = P.Ref('add_ref')
 
@@ -1,6 +1,7 @@
 from phi.api import *
 from phi import dsl
 import pytest
+import copy
 
 class TestDSL(object):
     """docstring for TestDSL."""
@@ -299,3 +300,183 @@ class TestDSL(object):
             P + 2,   # 20 + 2 == 22
             ReadList('a', 'b', P)  # [a, b, 22] == [2, 4, 22]
         )
+
+    def test_compile_containers(self):
+
+        #containers are parsed when the sequence is compiled
+        branches = [P, P + 1]
+        f = Seq(branches)
+        branches.append(P + 2)
+
+        assert f(1) == [1, 2]
+        assert Seq(branches)(1) == [1, 2, 3]
+
+        assert str(Seq(0.0)(1)) == "0.0"
+        assert str(Seq(-0.0)(1)) == "-0.0"
+        assert str(P.Pipe(1, (P, -0.0))[1]) == "-0.0"
+
+        assert P.Pipe() is None
+        assert P.Pipe(Read.a, P + 1, refs = dict(a = 1)) == 2
+
+    def test_val(self):
+
+        assert dsl._constant(1)(None, {}) == (1, {})
+        assert P.Val(True)(None) is True
+        assert type(P.Val(1)(None)) is int
+        assert P.Val([1])(None) == [1]
+
+    def test_map_filter(self):
+
+        f = P.map(P + 1).map(P * 2)
+
+        assert [4, 6, 8] == list(f([1, 2, 3]))
+
+        assert [4, 6, 8] == P.Pipe(
+            [1, 2, 3],
+            P.map(P + 1),
+            P.map(P * 2),
+            list
+        )
+
+        assert [6] == P.Pipe(
+            range(10),
+            P.filter(P % 2 == 0),
+            P.filter(P % 3 == 0),
+            P.filter(P > 0),
+            list
+        )
+
+        assert [3, 5] == list((P.map(P + 1) >> P.filter(P % 2 == 1))([1, 2, 3, 4]))
+
+    def test_jit(self):
+
+        assert dsl._get_source((P + 1) * P[0]) == "((x + (1)) * x[0])"
+        assert dsl._get_source(P + str) is None
+
+        f = Seq(P + 1, P * 3, -P, jit=True)
+        assert f(2) == -9
+
+        f = Seq(P + 1, str, jit=True)
+        assert f(2) == "3"
+
+        def square(x):
+            return x * x
+
+        f = Seq(P + 1, square, P - 1, jit=True)
+        assert f(2) == 8
+        assert dsl._jit_code((P + 1, square)) == (("(x + (1))", "_f0(x)"), (square,))
+
+    def test_jit_numba(self):
+        pytest.importorskip("numba")
+
+        def square(x):
+            return x * x
+
+        f = Seq(P + 1, square, P * 0.5, jit=True)
+        assert f(3) == 8.0
+        assert f(3.0) == 8.0
+
+        #numba can't compile strings, the python version is used from then on
+        f = Seq(P + P, jit=True)
+        assert f(2) == 4
+        assert f("a") == "aa"
+        assert f(3) == 6
+
+        #the fallback only affects the expression that failed
+        class Square(object):
+            def __mul__(self, other):
+                return "square"
+
+        f, g = Seq(P * P, jit=True), Seq(P * P, jit=True)
+        assert f(Square()) == "square"
+        assert f(2**40) == 2**80
+        assert g(2**40) != 2**80 #int64 overflow under numba
+
+    def test_seq_short_circuit(self):
+
+        f = P + 1
+
+        assert f.Seq() is f
+        assert dsl._compile_seq(()) is dsl.utils.state_identity
+        assert dsl._compile_seq((f,)) is f._f
+        assert Seq(P * 2)(3) == 6
+
+    def test_state_partial(self):
+
+        f = lambda *args: args
+
+        assert dsl._make_state_partial(0, f, (1, 2), {})(0, {}) == ((1, 2), {})
+        assert dsl._make_state_partial(1, f, (1, 2), {})(0, {}) == ((0, 1, 2), {})
+        assert dsl._make_state_partial(2, f, (1, 2), {})(0, {}) == ((1, 0, 2), {})
+        assert dsl._make_state_partial(3, f, (1, 2), {})(0, {}) == ((1, 2, 0), {})
+        assert dsl._make_state_partial(2, f, (1, 2, 3), {})(0, {}) == ((1, 0, 2, 3), {})
+
+    def test_pipe_refs_not_modified(self):
+
+        refs = dict(x = 1)
+
+        assert 2 == P.Pipe(2, Write(y = P), Read.y, refs = refs)
+        assert refs == dict(x = 1)
+
+    def test_chain(self):
+
+        f = P
+        for i in range(2000):
+            f = f.Then(lambda x: x + 1)
+
+        #stages are run in a loop, not in nested frames
+        assert f(0) == 2000
+        assert len(dsl._stages(f._f)) == 2000
+        assert len(dsl._stages((f >> f)._f)) == 4000
+
+        #composing doesn't copy the stages, they are flattened when the chain runs
+        assert len((f >> f)._f._parts) == 2
+        assert (f >> f)(0) == 4000
+
+    def test_compile_run(self):
+
+        g = dsl._compile_run([abs, str, len])
+        assert g(-10, {}) == (2, {})
+
+        f = Seq(abs, str, Write(s = P), len, P + 1, Read.s)
+        assert f(-10) == "10"
+
+    def test_unrolled_list(self):
+
+        f = List(P + 1, Write(a = P * 2), Read.a)
+        assert f(1) == [2, 2, 2]
+
+        assert dsl._unrolled_list([])(1, {}) == ([], {})
+        assert List(*[ P + i for i in range(20) ])(0) == list(range(20))
+
+        assert Tuple(P + 1, Write(a = P * 2), Read.a)(1) == (2, 2, 2)
+        assert Set(P, P + 1, 1)(1) == {1, 2}
+        assert Tuple()(1) == () and Set()(1) == set()
+        assert Tuple(*[ P + i for i in range(20) ])(0) == tuple(range(20))
+
+    def test_unrolled_dict(self):
+
+        f = Seq(Write(s = P * 2), Dict(a = P + 1, b = P * 3, c = Read.s))
+        rec = f(1)
+
+        assert type(rec) is dsl._RecordObject
+        assert rec == dict(a = 3, b = 6, c = 2)
+        assert rec.b == 6
+
+    def test_record_object_storage(self):
+
+        rec = dsl._RecordObject(a = 1)
+        rec.b = 2
+
+        assert rec == dict(a = 1, b = 2)
+        assert not hasattr(rec, "c")
+        assert copy.deepcopy(rec) == rec
+
+    def test_lifted(self):
+
+        assert dsl._parse(len)._f("abc", {}) == (3, {})
+        assert dsl._parse(dsl.utils.identity)._f is dsl.utils.state_identity
+        assert (P >> dsl.utils.identity)._f is dsl.utils.state_identity
+        assert Seq(len, dsl.utils.identity)("abc") == 3
+        f = P + 1
+        assert (f >> dsl.utils.identity)._f is f._f
@@ -96,25 +96,37 @@ def get_instance_methods(instance):
             yield method_name, method
 
 
-def _flatten_list(container):
-    for i in container:
-        if isinstance(i, list):
-            for j in flatten_list(i):
-                yield j
-        else:
-            yield i
-
 def flatten_list(container):
-    return list(_flatten_list(container))
+    "Flattens nested lists iteratively, keeping a stack of iterators instead of recursing into each level."
+    result = []
+    stack = [ iter(container) ]
 
+    while stack:
+        for i in stack[-1]:
+            if isinstance(i, list):
+                stack.append(iter(i))
+                break
 
-def _flatten(container):
-    for i in container:
-        if hasattr(i, '__iter__'):
-            for j in _flatten(i):
-                yield j
+            result.append(i)
         else:
-            yield i
+            stack.pop()
+
+    return result
+
 
 def flatten(container):
-    return list(_flatten(container))
+    "Same as `flatten_list` but for any iterable, strings are treated as atoms."
+    result = []
+    stack = [ iter(container) ]
+
+    while stack:
+        for i in stack[-1]:
+            if hasattr(i, '__iter__') and not isinstance(i, (str, bytes)):
+                stack.append(iter(i))
+                break
+
+            result.append(i)
+        else:
+            stack.pop()
+
+    return result
@@ -21,7 +21,7 @@ setup(
     license = "MIT",
     keywords = ["functional programming", "DSL"],
     url = "https://github.com/cgarciae/phi",
-   	packages = [
+    packages = [
         'phi',
         'phi.tests'
     ],